@@ -19,66 +19,421 @@ Future v2 improvements:
 - Anchors ^ and $
 """
 
+import collections
+import functools
+import importlib
+import os
+import random
+import re
+import threading
 import unittest
+import unittest.mock
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Optional, Sequence
 
+try:
+    from _simple_regex import c_matches  # type: ignore
+    HAVE_C_MATCHER = True
+except ImportError:
+    HAVE_C_MATCHER = False
 
-def _match_recursive(pattern: str, text: str, pattern_idx: int, text_idx: int) -> bool:
+try:
+    from numba import njit  # type: ignore
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# NFA instruction opcodes. Each instruction is an (op, arg, out) tuple:
+# - (_CHAR, c, out):   consume the literal character c, then go to out
+# - (_ANY, None, out): consume any single character, then go to out
+# - (_SPLIT, x, y):    epsilon-branch to both x and y
+# - (_MATCH, None, None): accepting state
+_CHAR = 0
+_ANY = 1
+_SPLIT = 2
+_MATCH = 3
+
+_Instruction = tuple[int, Any, Any]
+
+
+class NFA:
+    """
+    Thompson NFA compiled from a pattern.
+    
+    States are instruction indices into program. State sets are represented
+    as int bitmasks (bit i set = state i active), and eps_closure[i] is the
+    bitmask of consuming states (CHAR, ANY, MATCH) reachable from state i
+    through SPLIT instructions alone.
+    """
+    
+    __slots__ = ('program', 'eps_closure', 'start', 'match_mask')
+    
+    def __init__(self, program: list[_Instruction], eps_closure: list[int], start: int, match_mask: int):
+        self.program = program
+        self.eps_closure = eps_closure
+        self.start = start
+        self.match_mask = match_mask
+
+
+def _tokenize(pattern: str) -> list[tuple[str, bool]]:
+    """
+    Split a pattern into (char, starred) tokens.
+    
+    A character followed by '*' becomes a starred token; every other character,
+    including a '*' that doesn't follow an atom, is a plain token.
+    
+    Examples:
+        >>> _tokenize("a.*b")
+        [('a', False), ('.', True), ('b', False)]
+    """
+    tokens = []
+    i = 0
+    while i < len(pattern):
+        if i + 1 < len(pattern) and pattern[i + 1] == '*':
+            tokens.append((pattern[i], True))
+            i += 2
+        else:
+            tokens.append((pattern[i], False))
+            i += 1
+    return tokens
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize(pattern: str) -> str:
+    """
+    Rewrite a pattern into an equivalent star-normal form.
+    
+    Applies these rewrites until nothing changes:
+    - 'x*x*' -> 'x*' (adjacent stars over the same atom)
+    - '.*x*' -> '.*' and 'x*.*' -> '.*' ('.*' subsumes any other star)
+    - 'x*x'  -> 'xx*' (canonical order, so 'x*xx*' collapses too)
+    
+    Redundant adjacent stars are what make backtracking blow up and inflate
+    the NFA/DFA, and the result is cached per pattern.
+    
+    Examples:
+        >>> _normalize("a*a*a*b")
+        'a*b'
+        >>> _normalize(".*.*")
+        '.*'
+        >>> _normalize("a*ab")
+        'aa*b'
+    """
+    tokens = _tokenize(pattern)
+    while True:
+        result: list[tuple[str, bool]] = []
+        for char, starred in tokens:
+            if result and result[-1][1]:
+                prev_char = result[-1][0]
+                if starred:
+                    if prev_char == char or prev_char == '.':
+                        continue
+                    if char == '.':
+                        result[-1] = (char, starred)
+                        continue
+                # A literal '*' is left alone: '**' would re-tokenize differently
+                elif prev_char == char and char != '*':
+                    result[-1] = (char, False)
+                    result.append((char, True))
+                    continue
+            result.append((char, starred))
+        if result == tokens:
+            break
+        tokens = result
+    return ''.join(char + '*' if starred else char for char, starred in tokens)
+
+
+def _eps_closures(program: list[_Instruction]) -> list[int]:
     """
-    Recursive helper function for pattern matching with backtracking.
+    Return, for every state, the bitmask of consuming states reachable via SPLITs.
     
-    Handles:
-    - Literal characters
-    - '.' wildcard
-    - '*' operator (zero or more of preceding)
+    Uses an explicit stack rather than recursion, so patterns with thousands
+    of '*' operators don't hit the interpreter's recursion limit. Each state's
+    closure is computed once and reused by every SPLIT that reaches it; this
+    relies on the epsilon graph being acyclic, which holds because compile()
+    only emits SPLITs pointing forward.
+    """
+    closures = [0] * len(program)
+    done = [False] * len(program)
+    for root in range(len(program)):
+        stack = [root]
+        while stack:
+            pc = stack[-1]
+            if done[pc]:
+                stack.pop()
+                continue
+            op, x, y = program[pc]
+            if op != _SPLIT:
+                closures[pc] = 1 << pc
+            else:
+                pending = [target for target in (x, y) if not done[target]]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                closures[pc] = closures[x] | closures[y]
+            done[pc] = True
+            stack.pop()
+    return closures
+
+
+@functools.lru_cache(maxsize=256)
+def compile(pattern: str) -> NFA:
+    """
+    Compile a pattern into a Thompson NFA.
+    
+    'c*' compiles to a SPLIT that either enters a CHAR/ANY instruction looping
+    back to the SPLIT, or skips past it. Compiled NFAs are cached per pattern,
+    so repeated calls (e.g. from find_all_matches) compile only once.
     
     Args:
-        pattern: The full pattern string
-        text: The full text string
-        pattern_idx: Current position in pattern
-        text_idx: Current position in text
+        pattern: The pattern to compile
         
     Returns:
-        True if text[text_idx:] matches pattern[pattern_idx:], False otherwise
+        The compiled NFA
     """
-    # Base case: both pattern and text are exhausted
-    if pattern_idx >= len(pattern) and text_idx >= len(text):
-        return True
+    program: list[_Instruction] = []
+    for char, starred in _tokenize(pattern):
+        op = _ANY if char == '.' else _CHAR
+        arg = None if char == '.' else char
+        pc = len(program)
+        if starred:
+            program.append((_SPLIT, pc + 1, pc + 2))
+            program.append((op, arg, pc))
+        else:
+            program.append((op, arg, pc + 1))
+    program.append((_MATCH, None, None))
     
-    # If pattern is exhausted but text remains, no match
-    if pattern_idx >= len(pattern):
-        return False
+    eps_closure = _eps_closures(program)
+    return NFA(program, eps_closure, eps_closure[0], 1 << (len(program) - 1))
+
+
+def _nfa_step(nfa: NFA, states: int, char: str) -> int:
+    """Return the epsilon-closed NFA state set reached from states on char."""
+    program = nfa.program
+    eps_closure = nfa.eps_closure
+    following = 0
+    while states:
+        low_bit = states & -states
+        states ^= low_bit
+        op, arg, out = program[low_bit.bit_length() - 1]
+        if op == _ANY or (op == _CHAR and arg == char):
+            following |= eps_closure[out]
+    return following
+
+
+# Sentinel for a DFA transition that hasn't been computed yet
+_UNKNOWN = -1
+# Characters below this code point get a flat transition table per DFA state
+_ASCII_SIZE = 128
+# Most DFA states kept at once; reaching it flushes every built state
+_DFA_MAX_STATES = 2048
+# Most DFAs each thread keeps cached. A full DFA holds about 2.5 MB of
+# transition rows, so this bounds a thread's DFAs to roughly 40 MB
+_DFA_CACHE_SIZE = 16
+
+
+class _DFA:
+    """
+    Lazily subset-constructed DFA over an NFA.
     
-    # Check for * operator (lookahead)
-    if pattern_idx + 1 < len(pattern) and pattern[pattern_idx + 1] == '*':
-        # Handle * operator: zero or more of the preceding character
-        char_to_match = pattern[pattern_idx]
-        
-        # Greedy matching: try one or more occurrences first, then zero
-        # Try one or more occurrences: consume matching characters greedily
-        if text_idx < len(text):
-            # Check if current text character matches the pattern before *
-            if char_to_match == '.' or char_to_match == text[text_idx]:
-                # Consume one character and try again (stay at same pattern position for *)
-                if _match_recursive(pattern, text, pattern_idx, text_idx + 1):
-                    return True
-        
-        # Try zero occurrences: skip the 'char*' and continue
-        if _match_recursive(pattern, text, pattern_idx + 2, text_idx):
-            return True
+    Each DFA state stands for a set of NFA states (an NFA bitmask). States and
+    transitions are only built when a scan first needs them, so patterns whose
+    full subset construction would blow up never pay for unreachable states.
+    
+    ASCII transitions live in table[state][ord(char)]; other characters go
+    through the delta dict keyed on (state, char). State 0 is the dead state
+    (empty NFA set), from which nothing can match.
+    
+    universal[state] is True when the state accepts every possible remainder
+    of the text: it holds the ANY instruction of a '.*' loop from which MATCH
+    is reachable by epsilon moves alone. Scans can stop stepping there.
+    
+    At most max_states states exist at once. When a new state is needed past
+    that, every state but the dead and start states is flushed and the scan
+    carries on from a freshly added copy of its current state, so memory stays
+    bounded even when the text keeps reaching new NFA sets. The lists are
+    cleared in place, so scans may keep local references to them, but state
+    numbers other than 0 and start are only valid until the next step().
+    
+    A _DFA is not thread-safe; _nfa_to_dfa() keeps a separate one per thread.
+    """
+    
+    __slots__ = ('nfa', 'tail_mask', 'max_states', 'state_ids', 'state_sets', 'accept',
+                 'universal', 'table', 'delta', 'start')
+    
+    def __init__(self, nfa: NFA, max_states: int = _DFA_MAX_STATES):
+        self.nfa = nfa
+        # ANY instructions looping back to a SPLIT whose closure includes MATCH
+        self.tail_mask = 0
+        for pc, (op, arg, out) in enumerate(nfa.program):
+            if op == _ANY and out < pc and nfa.eps_closure[out] & nfa.match_mask:
+                self.tail_mask |= 1 << pc
+        # Room for the dead, start and current states, plus one to step to
+        self.max_states = max(max_states, 4)
+        self.state_ids: dict[int, int] = {}
+        self.state_sets: list[int] = []
+        self.accept: list[bool] = []
+        self.universal: list[bool] = []
+        self.table: list[list[int]] = []
+        self.delta: dict[tuple[int, str], int] = {}
+        self._add_state(0)
+        self.start = self._add_state(nfa.start)
+    
+    def _add_state(self, nfa_states: int) -> int:
+        state = self.state_ids.get(nfa_states)
+        if state is None:
+            state = len(self.state_sets)
+            self.state_ids[nfa_states] = state
+            self.state_sets.append(nfa_states)
+            self.accept.append(bool(nfa_states & self.nfa.match_mask))
+            self.universal.append(bool(nfa_states & self.tail_mask))
+            self.table.append([_UNKNOWN] * _ASCII_SIZE)
+        return state
+    
+    def _flush(self) -> None:
+        """Drop every state and transition, keeping the dead and start states."""
+        self.state_ids.clear()
+        del self.state_sets[:]
+        del self.accept[:]
+        del self.universal[:]
+        del self.table[:]
+        self.delta.clear()
+        self._add_state(0)
+        self._add_state(self.nfa.start)
+    
+    def step(self, state: int, char: str) -> int:
+        """Return the state reached from state on char, building it if needed."""
+        code = ord(char)
+        if code < _ASCII_SIZE:
+            following = self.table[state][code]
+            if following != _UNKNOWN:
+                return following
+        else:
+            cached = self.delta.get((state, char))
+            if cached is not None:
+                return cached
         
-        return False
+        nfa_states = self.state_sets[state]
+        following_states = _nfa_step(self.nfa, nfa_states, char)
+        known = self.state_ids.get(following_states)
+        if known is None:
+            if len(self.state_sets) >= self.max_states:
+                self._flush()
+                state = self._add_state(nfa_states)
+            following = self._add_state(following_states)
+        else:
+            following = known
+        if code < _ASCII_SIZE:
+            self.table[state][code] = following
+        else:
+            self.delta[(state, char)] = following
+        return following
+
+
+# Per-thread state: a _DFA grows while it scans, so threads never share one
+_thread_state = threading.local()
+
+
+def _nfa_to_dfa(nfa: NFA) -> _DFA:
+    """Return the (lazily built) DFA for nfa, shared across calls in this thread."""
+    dfas = getattr(_thread_state, 'dfas', None)
+    if dfas is None:
+        dfas = _thread_state.dfas = functools.lru_cache(maxsize=_DFA_CACHE_SIZE)(_DFA)
+    return dfas(nfa)
+
+
+# Patterns with at most this many '*' operators are delegated to the stdlib re
+# module. re backtracks, so k stars that can trade characters cost O(n^k);
+# beyond a single star the DFA is the safer choice.
+_RE_MAX_STARS = 1
+
+
+def _translate(pattern: str) -> str:
+    r"""
+    Translate a pattern into an equivalent stdlib re pattern.
     
-    # Handle regular character or '.' (not followed by *)
-    if text_idx >= len(text):
-        return False
+    '.' and 'c*' pass through unchanged; every other character, including re
+    metacharacters like '+', '?', '(' and a literal '*', is escaped.
     
-    char_to_match = pattern[pattern_idx]
+    Examples:
+        >>> _translate("a.*(b)")
+        'a.*\\(b\\)'
+    """
+    parts = []
+    for char, starred in _tokenize(pattern):
+        parts.append('.' if char == '.' else re.escape(char))
+        if starred:
+            parts.append('*')
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_re(pattern: str) -> Optional[re.Pattern]:
+    """Return the compiled stdlib re for pattern, or None if it has too many stars."""
+    if sum(starred for _, starred in _tokenize(pattern)) > _RE_MAX_STARS:
+        return None
+    # DOTALL so '.' also matches newlines, like the engine's own '.'
+    return re.compile(_translate(pattern), re.DOTALL)
+
+
+# Byte values of the pattern operators, for the bytes-based matcher
+_DOT = ord('.')
+_STAR = ord('*')
+
+
+def _match_bytes(pattern: bytes, text: bytes) -> bool:
+    """
+    Bottom-up DP matcher over ASCII-encoded pattern and text.
+    
+    dp[i * (n + 1) + j] is True when pattern[i:] matches text[j:]. The body is
+    plain integer indexing and comparison so that Numba can compile it as-is;
+    without Numba it still runs (slowly) as ordinary Python.
     
-    # Match single character
-    if char_to_match == '.' or char_to_match == text[text_idx]:
-        return _match_recursive(pattern, text, pattern_idx + 1, text_idx + 1)
+    Args:
+        pattern: The ASCII-encoded pattern
+        text: The ASCII-encoded text
+        
+    Returns:
+        True if text matches pattern, False otherwise
+    """
+    m = len(pattern)
+    n = len(text)
+    row = n + 1
+    dp = [False] * ((m + 1) * row)
+    dp[m * row + n] = True
     
-    return False
+    for i in range(m - 1, -1, -1):
+        char_to_match = pattern[i]
+        wildcard = char_to_match == _DOT
+        base = i * row
+        if i + 1 < m and pattern[i + 1] == _STAR:
+            skip = base + 2 * row
+            for j in range(n, -1, -1):
+                dp[base + j] = dp[skip + j] or (
+                    j < n
+                    and (wildcard or char_to_match == text[j])
+                    and dp[base + j + 1]
+                )
+        else:
+            following = base + row
+            for j in range(n - 1, -1, -1):
+                dp[base + j] = (wildcard or char_to_match == text[j]) and dp[following + j + 1]
+    
+    return dp[0]
+
+
+# The DP matchers allocate and fill an (m + 1) x (n + 1) table; above this
+# many cells the O(n) DFA is cheaper in both time and memory
+_DP_MAX_CELLS = 1 << 16
+
+
+# Under the mypyc build _match_bytes is a native function with no __code__
+# for Numba to compile, so only the pure-Python module gets the jitted path
+if HAVE_NUMBA and not hasattr(_match_bytes, '__code__'):
+    HAVE_NUMBA = False
+if HAVE_NUMBA:
+    _match_bytes_nb = njit(cache=True, boundscheck=False)(_match_bytes)
 
 
 def matches(pattern: str, text: str) -> bool:
@@ -114,7 +469,127 @@ def matches(pattern: str, text: str) -> bool:
         >>> matches("", "")
         True  # Empty strings match
     """
-    return _match_recursive(pattern, text, 0, 0)
+    pattern = _normalize(pattern)
+    text_is_ascii = text.isascii()
+    if text_is_ascii and pattern.isascii() and len(pattern) * len(text) <= _DP_MAX_CELLS:
+        if HAVE_C_MATCHER:
+            return c_matches(pattern.encode('ascii'), text.encode('ascii'))
+        if HAVE_NUMBA:
+            return _match_bytes_nb(pattern.encode('ascii'), text.encode('ascii'))
+    
+    compiled = _compile_re(pattern)
+    if compiled is not None:
+        return compiled.fullmatch(text) is not None
+    
+    dfa = _nfa_to_dfa(compile(pattern))
+    table = dfa.table
+    universal = dfa.universal
+    state = dfa.start
+    if universal[state]:
+        return True
+    if text_is_ascii:
+        # Iterating bytes yields ints that index the table directly, with no
+        # per-character str object, ord() call or range check
+        for code in text.encode('ascii'):
+            following = table[state][code]
+            state = following if following != _UNKNOWN else dfa.step(state, chr(code))
+            if not state:
+                return False
+            # Reached a '.*' tail: whatever is left of the text matches
+            if universal[state]:
+                return True
+    else:
+        for char in text:
+            code = ord(char)
+            following = table[state][code] if code < _ASCII_SIZE else _UNKNOWN
+            state = following if following != _UNKNOWN else dfa.step(state, char)
+            if not state:
+                return False
+            if universal[state]:
+                return True
+    
+    return dfa.accept[state]
+
+
+# Opt-in result cache for workloads that repeat the same (pattern, text)
+# queries. Off by default: for one-off queries the hashing and LRU upkeep cost
+# more than the match, and cached texts stay alive in memory.
+if os.environ.get("PATTERN_KEYS_CACHE", "0").strip().lower() in ("1", "true", "on", "yes"):
+    matches = functools.lru_cache(maxsize=65536)(matches)
+
+
+def _char_codes(text: str) -> Sequence[int]:
+    """
+    Return the code points of text as an indexable sequence of ints.
+    
+    Every start position rescans the text, so the conversion is done once up
+    front. ASCII text becomes a bytes object, whose items are cached small
+    ints read straight from a contiguous buffer; other text falls back to a
+    list of ord() values.
+    """
+    if text.isascii():
+        return text.encode('ascii')
+    return [ord(char) for char in text]
+
+
+def _pattern_bounds(pattern: str) -> tuple[int, Optional[int]]:
+    """
+    Return the (min_len, max_len) of texts the pattern can match.
+    
+    Each 'c*' token contributes (0, unbounded) and every other token (1, 1),
+    so max_len is None whenever the pattern contains a '*' operator.
+    
+    Examples:
+        >>> _pattern_bounds("a.c")
+        (3, 3)
+        >>> _pattern_bounds("a*bc")
+        (2, None)
+    """
+    tokens = _tokenize(pattern)
+    min_len = sum(not starred for _, starred in tokens)
+    max_len = None if any(starred for _, starred in tokens) else min_len
+    return min_len, max_len
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Return the longest literal prefix every match of pattern must start with.
+    
+    The prefix stops at the first '.' or starred token.
+    
+    Examples:
+        >>> _literal_prefix("abc*d")
+        'ab'
+        >>> _literal_prefix(".bc")
+        ''
+    """
+    prefix = []
+    for char, starred in _tokenize(pattern):
+        if starred or char == '.':
+            break
+        prefix.append(char)
+    return ''.join(prefix)
+
+
+def _required_literals(pattern: str) -> collections.Counter:
+    """
+    Count the literal characters every match of pattern must contain.
+    
+    Only plain literal tokens count; '.' and starred tokens can match
+    anything or nothing.
+    
+    Examples:
+        >>> _required_literals("ab*a.c")
+        Counter({'a': 2, 'c': 1})
+    """
+    return collections.Counter(
+        char for char, starred in _tokenize(pattern) if not starred and char != '.'
+    )
+
+
+def _has_required_literals(pattern: str, text: str) -> bool:
+    """Return False if text lacks enough copies of some required literal."""
+    return all(text.count(char) >= count for char, count in _required_literals(pattern).items())
 
 
 def find_all_matches(pattern: str, text: str) -> list[tuple[int, int, str]]:
@@ -138,20 +613,317 @@ def find_all_matches(pattern: str, text: str) -> list[tuple[int, int, str]]:
         >>> find_all_matches("a*b", "aab b ab")
         [(0, 3, 'aab'), (4, 5, 'b'), (6, 8, 'ab')]
     """
-    matches_list = []
+    return [(start, end, text[start:end]) for start, end in find_all_match_spans(pattern, text)]
+
+
+def find_all_match_spans(pattern: str, text: str) -> list[tuple[int, int]]:
+    """
+    Find the (start, end) offsets of all substrings of text matching the pattern.
+    
+    Same matches, in the same order, as find_all_matches(), without building
+    the matched substrings; callers that need one can take text[start:end].
+    
+    Args:
+        pattern: The pattern to match against
+        text: The text to search in
+        
+    Returns:
+        List of (start, end) tuples for all matches, end exclusive
+        
+    Examples:
+        >>> find_all_match_spans("a.c", "abc xyz abc")
+        [(0, 3), (8, 11)]
+    """
+    pattern = _normalize(pattern)
+    # A literal missing from the whole text rules out every substring at once
+    if not _has_required_literals(pattern, text):
+        return []
+    return _find_spans_between(pattern, text, _char_codes(text), 0, len(text) + 1)
+
+
+def _find_spans_between(pattern: str, text: str, codes: Sequence[int],
+                        first_start: int, start_stop: int) -> list[tuple[int, int]]:
+    """
+    Find all match spans of a normalized pattern starting in [first_start, start_stop).
+    
+    Matches may extend past start_stop, so parallel workers can split the
+    start positions of one shared text between them by offsets alone. codes is
+    _char_codes(text), passed in so workers convert the text only once.
+    """
+    dfa = _nfa_to_dfa(compile(pattern))
+    table = dfa.table
+    accept = dfa.accept
+    universal = dfa.universal
+    spans: list[tuple[int, int]] = []
+    
+    # A match needs at least min_len characters, so starts past
+    # len(text) - min_len can't match, and no match runs past max_len
+    text_len = len(text)
+    min_len, max_len = _pattern_bounds(pattern)
+    
+    last_start = min(text_len - min_len, start_stop - 1)
+    prefix = _literal_prefix(pattern)
+    starts: Sequence[int]
+    if prefix:
+        # Only positions where the literal prefix occurs can start a match;
+        # str.find jumps straight to them instead of trying every position
+        prefix_starts = []
+        start = text.find(prefix, first_start)
+        while 0 <= start <= last_start:
+            prefix_starts.append(start)
+            start = text.find(prefix, start + 1)
+        starts = prefix_starts
+    else:
+        starts = range(first_start, last_start + 1)
+    
+    # Run the DFA once from every candidate start position (including
+    # text_len, so an empty pattern can match the empty string at the end),
+    # recording every accepting end and stopping as soon as the dead state
+    # shows no longer match is possible
+    for start in starts:
+        state = dfa.start
+        if universal[state]:
+            spans.extend((start, tail_end) for tail_end in range(start, text_len + 1))
+            continue
+        if accept[state]:
+            spans.append((start, start))
+        stop = text_len if max_len is None else min(text_len, start + max_len)
+        for end in range(start, stop):
+            code = codes[end]
+            following = table[state][code] if code < _ASCII_SIZE else _UNKNOWN
+            state = following if following != _UNKNOWN else dfa.step(state, chr(code))
+            if not state:
+                break
+            if accept[state]:
+                # Reached a '.*' tail: every remaining end matches, so record
+                # them all without stepping the DFA through the rest
+                if universal[state]:
+                    spans.extend((start, tail_end) for tail_end in range(end + 1, text_len + 1))
+                    break
+                spans.append((start, end + 1))
+    
+    return spans
+
+
+# Texts shorter than this stay on the serial path: below it, process start-up
+# and pickling cost more than the scan itself
+_PARALLEL_MIN_TEXT = 16 * 1024
+
+
+def _parallelism_enabled() -> bool:
+    """Return False if PATTERN_KEYS_PARALLELISM turns parallel scanning off."""
+    value = os.environ.get("PATTERN_KEYS_PARALLELISM", "true")
+    return value.strip().lower() not in ("0", "false", "off", "no")
+
+
+# Per-process state for find_all_matches_parallel workers, set once by
+# _init_worker so each task only has to carry its start offsets
+_worker_pattern = ''
+_worker_text = ''
+_worker_codes: Sequence[int] = b''
+
+
+def _init_worker(pattern: str, text: str) -> None:
+    """Worker initializer: keep the pattern and text for every task."""
+    global _worker_pattern, _worker_text, _worker_codes
+    _worker_pattern = pattern
+    _worker_text = text
+    _worker_codes = _char_codes(text)
+
+
+def _find_spans_in_chunk(first_start: int, start_stop: int) -> list[tuple[int, int]]:
+    """Worker task: find match spans starting in [first_start, start_stop)."""
+    return _find_spans_between(_worker_pattern, _worker_text, _worker_codes, first_start, start_stop)
+
+
+def find_all_matches_parallel(pattern: str, text: str, min_chunk: int = 8192) -> list[tuple[int, int, str]]:
+    """
+    Find all substrings of text that match the pattern, using multiple processes.
     
-    # Try matching pattern starting at every position in text
-    for start in range(len(text) + 1):  # +1 to handle empty pattern matching empty text
-        # Try matching from this start position
-        # We need to check all possible end positions
-        for end in range(start, len(text) + 1):
-            substring = text[start:end]
-            if matches(pattern, substring):
-                matches_list.append((start, end, substring))
+    Same results as find_all_matches(). The start positions are split into
+    chunks of min_chunk positions, one task per chunk. Each worker process
+    receives the text once and tasks only carry (first_start, start_stop)
+    offsets, so matches crossing a chunk boundary are found without any
+    overlap slicing. Chunks own disjoint start positions, so merging needs no
+    deduplication.
     
+    Texts under 16 KiB, and any text when the PATTERN_KEYS_PARALLELISM
+    environment variable is set to 0/false/off/no, take the serial path.
+    
+    Args:
+        pattern: The pattern to match against
+        text: The text to search in
+        min_chunk: Number of start positions per worker task
+        
+    Returns:
+        List of (start, end, substring) tuples for all matches
+        
+    Raises:
+        ValueError: If min_chunk is less than 1
+    """
+    if min_chunk < 1:
+        raise ValueError(f"min_chunk must be at least 1, got {min_chunk}")
+    if len(text) < _PARALLEL_MIN_TEXT or not _parallelism_enabled():
+        return find_all_matches(pattern, text)
+    
+    pattern = _normalize(pattern)
+    if not _has_required_literals(pattern, text):
+        return []
+    
+    first_starts = range(0, len(text) + 1, min_chunk)
+    start_stops = [min(lo + min_chunk, len(text) + 1) for lo in first_starts]
+    
+    # Workers send back offsets only; substrings are sliced here
+    matches_list: list[tuple[int, int, str]] = []
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(pattern, text)) as executor:
+        for spans in executor.map(_find_spans_in_chunk, first_starts, start_stops):
+            matches_list.extend((start, end, text[start:end]) for start, end in spans)
     return matches_list
 
 
+class PatternSet:
+    """
+    A set of patterns matched together in a single pass over the text.
+    
+    The patterns' NFAs are unioned into one NFA (all of their start states are
+    active at once) and run through a single lazy DFA, built per thread by
+    _nfa_to_dfa(). Each pattern keeps its own MATCH state, so an accepting DFA
+    state tells which patterns matched.
+    
+    Examples:
+        >>> pattern_set = PatternSet()
+        >>> pattern_set.add("a*b")
+        0
+        >>> pattern_set.add("b.")
+        1
+        >>> pattern_set.scan("abc")
+        [(0, 0, 2), (0, 1, 2), (1, 1, 3)]
+    """
+    
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.patterns: list[str] = []
+        self._nfa: Optional[NFA] = None
+        self._match_bits: dict[int, int] = {}
+        self._accepted: dict[int, list[int]] = {}
+        for pattern in patterns:
+            self.add(pattern)
+    
+    def add(self, pattern: str) -> int:
+        """Add a pattern to the set and return its index."""
+        self.patterns.append(pattern)
+        self._nfa = None
+        return len(self.patterns) - 1
+    
+    def compile(self) -> None:
+        """Build the combined automaton; called automatically when needed."""
+        self._nfa = self._build_nfa()
+    
+    def _build_nfa(self) -> NFA:
+        program: list[_Instruction] = []
+        eps_closure: list[int] = []
+        start = 0
+        match_bits: dict[int, int] = {}
+        for index, pattern in enumerate(self.patterns):
+            nfa = compile(_normalize(pattern))
+            offset = len(program)
+            for op, arg, out in nfa.program:
+                if op == _SPLIT:
+                    program.append((op, arg + offset, out + offset))
+                elif op == _MATCH:
+                    program.append((op, arg, out))
+                else:
+                    program.append((op, arg, out + offset))
+            eps_closure.extend(states << offset for states in nfa.eps_closure)
+            start |= nfa.start << offset
+            match_bits[nfa.match_mask << offset] = index
+        
+        # Threads compiling at once build identical tables, so whichever
+        # assignment lands last is as good as any other
+        self._match_bits = match_bits
+        self._accepted = {}
+        return NFA(program, eps_closure, start, sum(match_bits))
+    
+    def _compiled_dfa(self) -> _DFA:
+        nfa = self._nfa
+        if nfa is None:
+            nfa = self._nfa = self._build_nfa()
+        return _nfa_to_dfa(nfa)
+    
+    def _accepted_by(self, dfa: _DFA, state: int) -> list[int]:
+        """Return the indices of the patterns accepting in DFA state state."""
+        # Keyed on the MATCH bits rather than the state number, which a DFA
+        # flush can reassign
+        hits = dfa.state_sets[state] & dfa.nfa.match_mask
+        accepted = self._accepted.get(hits)
+        if accepted is None:
+            accepted = self._accepted[hits] = [
+                index for bit, index in self._match_bits.items() if hits & bit
+            ]
+        return accepted
+    
+    def scan(self, text: str) -> list[tuple[int, int, int]]:
+        """
+        Find every substring of text matched by any pattern in the set.
+        
+        Returns:
+            List of (pattern_index, start, end) tuples ordered by start, then
+            end, then pattern index; end is exclusive
+        """
+        dfa = self._compiled_dfa()
+        table = dfa.table
+        accept = dfa.accept
+        codes = _char_codes(text)
+        results: list[tuple[int, int, int]] = []
+        
+        for start in range(len(text) + 1):
+            state = dfa.start
+            if accept[state]:
+                results.extend((index, start, start) for index in self._accepted_by(dfa, state))
+            for end in range(start, len(text)):
+                code = codes[end]
+                following = table[state][code] if code < _ASCII_SIZE else _UNKNOWN
+                state = following if following != _UNKNOWN else dfa.step(state, chr(code))
+                if not state:
+                    break
+                if accept[state]:
+                    results.extend((index, start, end + 1) for index in self._accepted_by(dfa, state))
+        
+        return results
+    
+    def fullmatch(self, text: str) -> list[bool]:
+        """Return, for each pattern in the set, whether it matches all of text."""
+        dfa = self._compiled_dfa()
+        state = dfa.start
+        for char in text:
+            state = dfa.step(state, char)
+            if not state:
+                break
+        matched = [False] * len(self.patterns)
+        for index in self._accepted_by(dfa, state):
+            matched[index] = True
+        return matched
+
+
+@functools.lru_cache(maxsize=64)
+def _pattern_set(patterns: tuple[str, ...]) -> PatternSet:
+    """Return a compiled PatternSet for patterns, shared across calls."""
+    return PatternSet(patterns)
+
+
+def matches_many(patterns: list[str], text: str) -> list[bool]:
+    """
+    Check text against many patterns in a single pass.
+    
+    Equivalent to [matches(p, text) for p in patterns], but the text is only
+    scanned once, by the combined automaton of a PatternSet.
+    
+    Examples:
+        >>> matches_many(["a*b", "a.b", "c"], "aab")
+        [True, True, False]
+    """
+    return _pattern_set(tuple(patterns)).fullmatch(text)
+
+
 class TestSimpleRegexMatcher(unittest.TestCase):
     """Test suite for SimpleRegexMatcher."""
     
@@ -242,6 +1014,214 @@ class TestSimpleRegexMatcher(unittest.TestCase):
         self.assertTrue(matches(".*.*", "xy"))
         self.assertTrue(matches(".*.*", "xyz"))
     
+    def test_pathological_star_patterns(self):
+        """Test that redundant '*' patterns don't backtrack exponentially."""
+        self.assertFalse(matches("a*" * 20 + "b", "a" * 40))
+        self.assertTrue(matches("a*" * 20 + "b", "a" * 40 + "b"))
+        self.assertFalse(matches(".*" * 10 + "x", "y" * 60))
+    
+    def test_normalize(self):
+        """Test star-normal-form rewriting of redundant stars."""
+        self.assertEqual(_normalize("a*a*a*b"), "a*b")
+        self.assertEqual(_normalize(".*.*"), ".*")
+        self.assertEqual(_normalize(".*a*b*"), ".*")
+        self.assertEqual(_normalize("a*.*"), ".*")
+        self.assertEqual(_normalize("a*ab"), "aa*b")
+        self.assertEqual(_normalize("a*aa*"), "aa*")
+        self.assertEqual(_normalize("a*b*c"), "a*b*c")
+        self.assertEqual(_normalize("***"), "***")
+        self.assertTrue(matches(".*.*", "xyz"))
+        self.assertTrue(matches("a*b*c", "aabbc"))
+    
+    def test_compile(self):
+        """Test NFA compilation and caching."""
+        nfa = compile("a*b")
+        self.assertIs(nfa, compile("a*b"))
+        self.assertEqual(nfa.program[-1][0], _MATCH)
+        self.assertFalse(nfa.start & nfa.match_mask)
+        self.assertTrue(compile("a*").start & compile("a*").match_mask)
+    
+    def test_dfa_states_are_shared(self):
+        """Test that the lazy DFA is reused and only grows on new transitions."""
+        dfa = _nfa_to_dfa(compile("a*b*c"))
+        self.assertIs(dfa, _nfa_to_dfa(compile("a*b*c")))
+        self.assertTrue(matches("a*b*c", "aabc"))
+        state_count = len(dfa.state_sets)
+        self.assertTrue(matches("a*b*c", "aaaabbc"))
+        self.assertEqual(len(dfa.state_sets), state_count)
+        self.assertFalse(matches("a*b*c", "aébéc"))
+        self.assertTrue(matches("é*b*c", "ééc"))
+    
+    def test_dfa_state_cap(self):
+        """Test that the lazy DFA flushes instead of growing without bound."""
+        pattern = ".*a" + "." * 12 + "b*"
+        rng = random.Random(0)
+        text = "".join(rng.choice("ab") for _ in range(5000))
+        expected = re.fullmatch(_translate(pattern), text, re.DOTALL) is not None
+        dfa = _DFA(compile(pattern), max_states=64)
+        state = dfa.start
+        for char in text:
+            state = dfa.step(state, char)
+            self.assertLessEqual(len(dfa.state_sets), 64)
+        self.assertEqual(dfa.accept[state], expected)
+        self.assertEqual(dfa.start, 1)
+        self.assertEqual(matches(pattern, text), expected)
+        self.assertLessEqual(len(_nfa_to_dfa(compile(pattern)).state_sets), _DFA_MAX_STATES)
+        self.assertEqual(find_all_match_spans(pattern, text[:200]),
+                         [(start, end) for start in range(201) for end in range(start, 201)
+                          if re.fullmatch(_translate(pattern), text[start:end])])
+    
+    def test_dfa_threads(self):
+        """Test that threads scanning the same pattern don't share a DFA."""
+        pattern = ".*a" + "." * 12 + "b*"
+        compiled = re.compile(_translate(pattern), re.DOTALL)
+        failures = []
+        
+        def scan(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(5):
+                text = "".join(rng.choice("ab") for _ in range(3000))
+                try:
+                    if matches(pattern, text) != (compiled.fullmatch(text) is not None):
+                        failures.append(text)
+                except Exception as error:
+                    failures.append(error)
+        
+        threads = [threading.Thread(target=scan, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        dfa = _nfa_to_dfa(compile(pattern))
+        other = []
+        thread = threading.Thread(target=lambda: other.append(_nfa_to_dfa(compile(pattern))))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], dfa)
+    
+    def test_re_metacharacters_are_literal(self):
+        """Test that stdlib re metacharacters match themselves."""
+        self.assertEqual(_translate("a.*(b)"), "a.*\\(b\\)")
+        self.assertTrue(matches("a+b?", "a+b?"))
+        self.assertFalse(matches("a+b", "aab"))
+        self.assertTrue(matches("[x]*", "[x]]]"))
+        self.assertTrue(matches("^a$", "^a$"))
+        self.assertTrue(matches("a.c", "a\nc"))
+        self.assertTrue(matches(".*", "line one\nline two"))
+    
+    def test_match_bytes(self):
+        """Test the bytes-based DP matcher used by the Numba path."""
+        self.assertTrue(_match_bytes(b"a*b*c", b"aabbc"))
+        self.assertFalse(_match_bytes(b"a*b*c", b"aabbcc"))
+        self.assertTrue(_match_bytes(b".*", b""))
+        self.assertTrue(_match_bytes(b"a**", b"aa*"))
+        self.assertFalse(_match_bytes(b"abc", b"ab"))
+    
+    @unittest.skipUnless(HAVE_NUMBA, "numba is not installed")
+    def test_match_bytes_numba(self):
+        """Test the Numba-compiled bytes matcher against the interpreted one."""
+        for pattern, text in ((b"a*b*c", b"aabbc"), (b"a*b*c", b"aabbcc"), (b".*", b""),
+                              (b"a**", b"aa*"), (b"abc", b"ab"), (b"", b"")):
+            self.assertEqual(_match_bytes_nb(pattern, text), _match_bytes(pattern, text))
+    
+    def test_find_all_matches_parallel(self):
+        """Test that parallel scanning agrees with the serial path."""
+        text = "abcab" * 4000
+        for pattern in ("a.c", "b*ca*", ""):
+            expected = find_all_matches(pattern, text)
+            self.assertEqual(find_all_matches_parallel(pattern, text, min_chunk=4096), expected)
+        # A single match spanning every chunk
+        text = "q" + "z" * 20000 + "q"
+        self.assertEqual(find_all_matches_parallel("qz*q", text, min_chunk=4096),
+                         [(0, len(text), text)])
+        self.assertEqual(find_all_matches_parallel("a.c", "abc"), [(0, 3, "abc")])
+        for min_chunk in (0, -1):
+            with self.assertRaises(ValueError):
+                find_all_matches_parallel("a", "a" * 20000, min_chunk=min_chunk)
+    
+    def test_pattern_set(self):
+        """Test single-pass matching of many patterns."""
+        pattern_set = PatternSet(["a*b", "b."])
+        self.assertEqual(pattern_set.add("c"), 2)
+        self.assertEqual(pattern_set.scan("abc"),
+                         [(0, 0, 2), (0, 1, 2), (1, 1, 3), (2, 2, 3)])
+        self.assertEqual(pattern_set.fullmatch("aab"), [True, False, False])
+        self.assertEqual(PatternSet().scan("abc"), [])
+        self.assertEqual(matches_many(["a*b", "a.b", "c", ""], "aab"),
+                         [True, True, False, False])
+        self.assertEqual(matches_many(["a*", "", "é*"], ""), [True, True, True])
+    
+    def test_pattern_set_threads(self):
+        """Test that threads sharing a PatternSet each get their own DFA."""
+        patterns = [".*a" + "." * 12 + "b*", "a*b*"]
+        compiled = re.compile(_translate(patterns[0]), re.DOTALL)
+        failures = []
+        
+        def scan(seed):
+            rng = random.Random(seed)
+            for _ in range(5):
+                text = "".join(rng.choice("ab") for _ in range(3000))
+                try:
+                    if matches_many(patterns, text)[0] != (compiled.fullmatch(text) is not None):
+                        failures.append(text)
+                except Exception as error:
+                    failures.append(error)
+        
+        threads = [threading.Thread(target=scan, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+    
+    def test_dot_star_tail(self):
+        """Test that scans stop stepping once a '.*' tail is reached."""
+        dfa = _nfa_to_dfa(compile("a*b.*"))
+        self.assertFalse(dfa.universal[dfa.start])
+        self.assertTrue(dfa.universal[dfa.step(dfa.start, "b")])
+        self.assertFalse(any(_nfa_to_dfa(compile("a*.*b")).universal))
+        self.assertTrue(matches("a*b.*", "aab" + "é" * 10000))
+        self.assertFalse(matches("a*b.*", "aac" + "x" * 10))
+        self.assertEqual(find_all_match_spans("a*b.*", "xaby"),
+                         [(1, 3), (1, 4), (2, 3), (2, 4)])
+    
+    @unittest.skipUnless(__file__.endswith(".py"), "a compiled module can't be reloaded")
+    def test_result_cache(self):
+        """Test that PATTERN_KEYS_CACHE=1 wraps matches in an lru_cache."""
+        module = importlib.import_module("SimpleRegexMatcher")
+        try:
+            with unittest.mock.patch.dict(os.environ, {"PATTERN_KEYS_CACHE": "1"}):
+                cached = importlib.reload(module)
+            self.assertTrue(hasattr(cached.matches, "cache_info"))
+            self.assertTrue(cached.matches("a*b*c", "aabbc"))
+            self.assertTrue(cached.matches("a*b*c", "aabbc"))
+            self.assertFalse(cached.matches("a*b*c", "aabbcc"))
+            self.assertEqual(cached.matches.cache_info().hits, 1)
+        finally:
+            with unittest.mock.patch.dict(os.environ, {"PATTERN_KEYS_CACHE": "0"}):
+                importlib.reload(module)
+        self.assertFalse(hasattr(module.matches, "cache_info"))
+    
+    def test_literal_star(self):
+        """Test that a '*' with nothing to repeat is matched literally."""
+        self.assertTrue(matches("*", "*"))
+        self.assertTrue(matches("**", "***"))
+        self.assertTrue(matches("a**", "aa*"))
+        self.assertFalse(matches("a**", "aa"))
+    
+    def test_many_stars(self):
+        """Test patterns with more '*' operators than the recursion limit."""
+        pattern = "a*b*" * 1500 + "c"
+        self.assertTrue(matches(pattern, "ab" * 50 + "c"))
+        self.assertFalse(matches(pattern, "ab" * 50))
+    
+    def test_long_text(self):
+        """Test texts longer than the interpreter's recursion limit."""
+        self.assertTrue(matches(".*", "x" * 5000))
+        self.assertTrue(matches("a*b", "a" * 5000 + "b"))
+        self.assertFalse(matches("a*b", "a" * 5000))
+    
     def test_find_all_matches_basic(self):
         """Test find_all_matches with basic patterns."""
         results = find_all_matches("a.c", "abc xyz abc")
@@ -268,6 +1248,46 @@ class TestSimpleRegexMatcher(unittest.TestCase):
         # Should match at positions 0, 1, 2, 3
         self.assertEqual(len(results), 4)
     
+    def test_find_all_matches_long_text(self):
+        """Test find_all_matches on text much longer than any match."""
+        text = "abc" * 2000
+        results = find_all_matches("a.c", text)
+        self.assertEqual(len(results), 2000)
+        self.assertEqual(results[-1], (5997, 6000, "abc"))
+    
+    def test_pattern_bounds(self):
+        """Test min/max match length computation."""
+        self.assertEqual(_pattern_bounds(""), (0, 0))
+        self.assertEqual(_pattern_bounds("a.c"), (3, 3))
+        self.assertEqual(_pattern_bounds("a*bc"), (2, None))
+        self.assertEqual(_pattern_bounds("a**"), (1, None))
+        self.assertEqual(find_all_matches("abcd", "abc"), [])
+    
+    def test_literal_prefix(self):
+        """Test literal prefix extraction and prefix-driven scanning."""
+        self.assertEqual(_literal_prefix("abc*d"), "ab")
+        self.assertEqual(_literal_prefix("café"), "café")
+        self.assertEqual(_literal_prefix(".bc"), "")
+        self.assertEqual(_literal_prefix("a*b"), "")
+        self.assertEqual(find_all_matches("aa", "aaaa"),
+                         [(0, 2, "aa"), (1, 3, "aa"), (2, 4, "aa")])
+    
+    def test_required_literals(self):
+        """Test required-literal counting and early rejection."""
+        self.assertEqual(_required_literals("ab*a.c"), {"a": 2, "c": 1})
+        self.assertEqual(_required_literals(".*"), {})
+        self.assertEqual(find_all_matches("a.a", "abcb"), [])
+        self.assertEqual(find_all_matches("xa*", "aaaa"), [])
+        self.assertEqual(find_all_matches("a.a", "aba"), [(0, 3, "aba")])
+    
+    def test_find_all_match_spans(self):
+        """Test that span results line up with find_all_matches."""
+        self.assertEqual(find_all_match_spans("a.c", "abc xyz abc"), [(0, 3), (8, 11)])
+        self.assertEqual(find_all_match_spans("", "ab"), [(0, 0), (1, 1), (2, 2)])
+        self.assertEqual(
+            [(start, end, "aab b ab"[start:end]) for start, end in find_all_match_spans("a*b", "aab b ab")],
+            find_all_matches("a*b", "aab b ab"))
+    
     def test_find_all_matches_overlapping(self):
         """Test that find_all_matches finds overlapping matches."""
         results = find_all_matches(".*", "abc")
@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython port of SimpleRegexMatcher's bottom-up DP matcher.
+
+Build with `python setup.py build_ext --inplace`. SimpleRegexMatcher imports
+c_matches when the extension is available and routes ASCII inputs through it.
+"""
+
+from libc.stdlib cimport free, malloc
+from libc.string cimport memset
+
+cdef unsigned char DOT = 46   # ord('.')
+cdef unsigned char STAR = 42  # ord('*')
+
+
+cdef bint _match_dp(const unsigned char[::1] pattern, const unsigned char[::1] text,
+                    Py_ssize_t m, Py_ssize_t n, char *dp) noexcept nogil:
+    # dp[i * (n + 1) + j] is true when pattern[i:] matches text[j:]
+    cdef Py_ssize_t row = n + 1
+    cdef Py_ssize_t i, j, base, other
+    cdef unsigned char char_to_match
+    cdef bint wildcard
+
+    memset(dp, 0, (m + 1) * row)
+    dp[m * row + n] = 1
+
+    for i in range(m - 1, -1, -1):
+        char_to_match = pattern[i]
+        wildcard = char_to_match == DOT
+        base = i * row
+        if i + 1 < m and pattern[i + 1] == STAR:
+            # 'char*': skip it entirely, or consume one char and stay on it
+            other = base + 2 * row
+            dp[base + n] = dp[other + n]
+            for j in range(n - 1, -1, -1):
+                dp[base + j] = dp[other + j] or (
+                    (wildcard or char_to_match == text[j]) and dp[base + j + 1])
+        else:
+            other = base + row
+            for j in range(n - 1, -1, -1):
+                dp[base + j] = (wildcard or char_to_match == text[j]) and dp[other + j + 1]
+
+    return dp[0]
+
+
+def c_matches(const unsigned char[::1] pattern, const unsigned char[::1] text):
+    """
+    Check if ASCII-encoded text matches ASCII-encoded pattern.
+
+    Same semantics as SimpleRegexMatcher.matches(), computed with a C loop over
+    a heap-allocated (len(pattern) + 1) * (len(text) + 1) table.
+    """
+    cdef Py_ssize_t m = pattern.shape[0]
+    cdef Py_ssize_t n = text.shape[0]
+    cdef char *dp = <char *> malloc((m + 1) * (n + 1))
+    cdef bint result
+
+    if dp == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            result = _match_dp(pattern, text, m, n, dp)
+    finally:
+        free(dp)
+    return result
@@ -0,0 +1,23 @@
+import os
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # Cython is optional: without it this installs the pure-Python module only
+    ext_modules = []
+else:
+    ext_modules = cythonize(["_simple_regex.pyx"])
+
+# PATTERN_KEYS_MYPYC=1 also compiles SimpleRegexMatcher itself with mypyc
+if os.environ.get("PATTERN_KEYS_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules += mypycify(["SimpleRegexMatcher.py"])
+
+setup(
+    name="pattern-keys-regex",
+    py_modules=["SimpleRegexMatcher"],
+    ext_modules=ext_modules,
+)